@@ -3,7 +3,7 @@ import { db } from '@/lib/db';
 import { requireAuth } from '@/lib/auth/session';
 import { requirePermission, Permission, canAccessDistrict } from '@/lib/rbac';
 import { createAuditLog } from '@/lib/db/audit';
-import { ASSESSMENT_SECTION_DEFS } from '@/config/assessment-sections';
+import { ASSESSMENT_SECTION_DEFS, getSectionDef } from '@/config/assessment-sections';
 import {
   computeFullAssessment,
   type ResponseMap,
@@ -12,6 +12,11 @@ import {
 
 type RouteContext = { params: Promise<{ id: string }> };
 
+/** Codes of all required questions; the definitions are static. */
+const REQUIRED_QUESTION_CODES = ASSESSMENT_SECTION_DEFS.flatMap((s) =>
+  s.questions.filter((q) => q.required).map((q) => q.code),
+);
+
 // ---------------------------------------------------------------------------
 // POST /api/assessments/[id]/submit — score and submit an assessment
 // ---------------------------------------------------------------------------
@@ -80,14 +85,12 @@ export async function POST(request: NextRequest, context: RouteContext) {
     }
 
     // Compute actual completion percentage based on required questions answered
-    const totalRequired = ASSESSMENT_SECTION_DEFS.flatMap((s) =>
-      s.questions.filter((q) => q.required),
-    ).length;
-    const answeredRequired = ASSESSMENT_SECTION_DEFS.flatMap((s) =>
-      s.questions.filter(
-        (q) => q.required && allResponses[q.code]?.value !== undefined && allResponses[q.code]?.value !== '',
-      ),
-    ).length;
+    const totalRequired = REQUIRED_QUESTION_CODES.length;
+    let answeredRequired = 0;
+    for (const code of REQUIRED_QUESTION_CODES) {
+      const value = allResponses[code]?.value;
+      if (value !== undefined && value !== '') answeredRequired++;
+    }
     const actualCompletionPct =
       totalRequired > 0 ? Math.round((answeredRequired / totalRequired) * 100) : 0;
 
@@ -129,6 +132,16 @@ export async function POST(request: NextRequest, context: RouteContext) {
         const sectionId = sectionNumToId.get(result.sectionNumber);
         if (!sectionId) continue;
 
+        const scoreData = {
+          rawScore: result.rawScore,
+          maxScore: result.maxScore,
+          percentage: result.percentage,
+          colorStatus: result.colorStatus,
+          criticalFlags: JSON.stringify(result.criticalFlags),
+          details: JSON.stringify(result.details),
+          computedAt: now,
+        };
+
         await tx.domainScore.upsert({
           where: {
             assessmentId_sectionId: {
@@ -136,26 +149,8 @@ export async function POST(request: NextRequest, context: RouteContext) {
               sectionId,
             },
           },
-          create: {
-            assessmentId: id,
-            sectionId,
-            rawScore: result.rawScore,
-            maxScore: result.maxScore,
-            percentage: result.percentage,
-            colorStatus: result.colorStatus,
-            criticalFlags: JSON.stringify(result.criticalFlags),
-            details: JSON.stringify(result.details),
-            computedAt: now,
-          },
-          update: {
-            rawScore: result.rawScore,
-            maxScore: result.maxScore,
-            percentage: result.percentage,
-            colorStatus: result.colorStatus,
-            criticalFlags: JSON.stringify(result.criticalFlags),
-            details: JSON.stringify(result.details),
-            computedAt: now,
-          },
+          create: { assessmentId: id, sectionId, ...scoreData },
+          update: scoreData,
         });
       }
 
@@ -170,41 +165,26 @@ export async function POST(request: NextRequest, context: RouteContext) {
       // Identify top RED domains for summary
       const topRedDomains = sectionResults
         .filter((r) => r.colorStatus === 'RED')
-        .map((r) => {
-          const sec = ASSESSMENT_SECTION_DEFS.find(
-            (s) => s.number === r.sectionNumber,
-          );
-          return sec?.title ?? `Section ${r.sectionNumber}`;
-        });
+        .map((r) => getSectionDef(r.sectionNumber)?.title ?? `Section ${r.sectionNumber}`);
 
       // 4. Upsert VisitSummary
+      const summaryData = {
+        overallStatus,
+        redCount,
+        yellowCount,
+        lightGreenCount,
+        darkGreenCount,
+        totalScored: scoredSectionCount,
+        completionPct: actualCompletionPct,
+        criticalFlags: JSON.stringify(criticalFlags),
+        topRedDomains: JSON.stringify(topRedDomains),
+        computedAt: now,
+      };
+
       await tx.visitSummary.upsert({
         where: { visitId: assessment.visitId },
-        create: {
-          visitId: assessment.visitId,
-          overallStatus,
-          redCount,
-          yellowCount,
-          lightGreenCount,
-          darkGreenCount,
-          totalScored: scoredSectionCount,
-          completionPct: actualCompletionPct,
-          criticalFlags: JSON.stringify(criticalFlags),
-          topRedDomains: JSON.stringify(topRedDomains),
-          computedAt: now,
-        },
-        update: {
-          overallStatus,
-          redCount,
-          yellowCount,
-          lightGreenCount,
-          darkGreenCount,
-          totalScored: scoredSectionCount,
-          completionPct: actualCompletionPct,
-          criticalFlags: JSON.stringify(criticalFlags),
-          topRedDomains: JSON.stringify(topRedDomains),
-          computedAt: now,
-        },
+        create: { visitId: assessment.visitId, ...summaryData },
+        update: summaryData,
       });
     });
 
@@ -233,7 +213,7 @@ export async function POST(request: NextRequest, context: RouteContext) {
       overallStatus,
       sectionResults: sectionResults.map((r) => ({
         sectionNumber: r.sectionNumber,
-        title: ASSESSMENT_SECTION_DEFS.find((s) => s.number === r.sectionNumber)?.title,
+        title: getSectionDef(r.sectionNumber)?.title,
         rawScore: r.rawScore,
         maxScore: r.maxScore,
         percentage: r.percentage,
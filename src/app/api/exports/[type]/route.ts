@@ -252,11 +252,16 @@ export async function GET(
       console.error('[AUDIT] Failed to log export action:', err),
     );
 
-    // Return file response
+    // Return file response. The workbook buffer is passed as a view over the
+    // same memory rather than copied, so large exports are held only once.
     const body =
       typeof fileBuffer === 'string'
-        ? new TextEncoder().encode(fileBuffer)
-        : new Uint8Array(fileBuffer);
+        ? fileBuffer
+        : new Uint8Array(
+            fileBuffer.buffer as ArrayBuffer,
+            fileBuffer.byteOffset,
+            fileBuffer.byteLength,
+          );
 
     return new NextResponse(body, {
       status: 200,
@@ -1211,18 +1211,22 @@ export const ASSESSMENT_SECTION_DEFS: SectionDef[] = [
 // Lookup helpers
 // ---------------------------------------------------------------------------
 
+const SECTION_DEFS_BY_NUMBER = new Map(
+  ASSESSMENT_SECTION_DEFS.map((s) => [s.number, s]),
+);
+
+const QUESTION_DEFS_BY_CODE = new Map(
+  ASSESSMENT_SECTION_DEFS.flatMap((s) => s.questions.map((q) => [q.code, q] as const)),
+);
+
 /** Get a section definition by number */
 export function getSectionDef(sectionNumber: number): SectionDef | undefined {
-  return ASSESSMENT_SECTION_DEFS.find((s) => s.number === sectionNumber);
+  return SECTION_DEFS_BY_NUMBER.get(sectionNumber);
 }
 
 /** Get a question definition by code (searches all sections) */
 export function getQuestionDef(code: string): QuestionDef | undefined {
-  for (const section of ASSESSMENT_SECTION_DEFS) {
-    const q = section.questions.find((q) => q.code === code);
-    if (q) return q;
-  }
-  return undefined;
+  return QUESTION_DEFS_BY_CODE.get(code);
 }
 
 /** Get all question codes for a section */
@@ -102,35 +102,62 @@ export async function runDataQualityChecks(visitId: string): Promise<void> {
   });
 
   // -----------------------------------------------------------------------
-  // 1. Missing required responses
+  // 1. Missing required responses, and
+  // 4. Missing evidence notes on required fields
+  //
+  // Both checks walk every question, so they share one pass. Evidence flags
+  // are collected separately and appended after checks 2 and 3 so the flag
+  // order is unchanged.
   // -----------------------------------------------------------------------
+  const evidenceFlags: DQFlagInput[] = [];
+
   for (const section of ASSESSMENT_SECTION_DEFS) {
     for (const question of section.questions) {
-      if (!question.required) continue;
+      if (!question.required && !question.requiresEvidence) continue;
+
+      const resp = responseMap.get(question.code);
 
-      // Check if the question is visible (branch condition met)
-      if (question.branchCondition) {
-        const parentResp = responseMap.get(question.branchCondition.questionCode);
-        if (!isConditionMet(question.branchCondition, parentResp?.value ?? null)) {
-          continue; // Question not visible; skip
+      if (question.required) {
+        // Check if the question is visible (branch condition met)
+        const isVisible = !question.branchCondition || isConditionMet(
+          question.branchCondition,
+          responseMap.get(question.branchCondition.questionCode)?.value ?? null,
+        );
+        const isMissing = !resp || (resp.value === null && resp.numericValue === null);
+
+        if (isVisible && isMissing) {
+          flags.push({
+            visitId,
+            entityType: 'ASSESSMENT',
+            entityId: assessment.id,
+            flagType: 'MISSING_VALUE',
+            severity: 'HIGH',
+            description: `Required response missing for "${question.text}" in Section ${section.number} (${section.title})`,
+            fieldName: question.code,
+            currentValue: null,
+            suggestedFix: 'Please provide a response for this required question.',
+          });
         }
       }
 
-      const resp = responseMap.get(question.code);
-      const isMissing = !resp || (resp.value === null && resp.numericValue === null);
-
-      if (isMissing) {
-        flags.push({
-          visitId,
-          entityType: 'ASSESSMENT',
-          entityId: assessment.id,
-          flagType: 'MISSING_VALUE',
-          severity: 'HIGH',
-          description: `Required response missing for "${question.text}" in Section ${section.number} (${section.title})`,
-          fieldName: question.code,
-          currentValue: null,
-          suggestedFix: 'Please provide a response for this required question.',
-        });
+      if (question.requiresEvidence && resp) {
+        // Only flag if the question was answered but evidence is missing
+        const hasResponse = resp.value !== null || resp.numericValue !== null;
+        const hasEvidence = resp.evidenceNotes !== null && resp.evidenceNotes.trim().length > 0;
+
+        if (hasResponse && !hasEvidence) {
+          evidenceFlags.push({
+            visitId,
+            entityType: 'ASSESSMENT',
+            entityId: assessment.id,
+            flagType: 'MISSING_EVIDENCE',
+            severity: 'MEDIUM',
+            description: `Evidence notes required but missing for "${question.text}" in Section ${section.number} (${section.title})`,
+            fieldName: question.code,
+            currentValue: resp.value ?? String(resp.numericValue),
+            suggestedFix: 'Please add evidence notes to support this response.',
+          });
+        }
       }
     }
   }
@@ -145,35 +172,7 @@ export async function runDataQualityChecks(visitId: string): Promise<void> {
   // -----------------------------------------------------------------------
   checkIncompleteSections(ASSESSMENT_SECTION_DEFS, responseMap, visitId, assessment.id, flags);
 
-  // -----------------------------------------------------------------------
-  // 4. Missing evidence notes on required fields
-  // -----------------------------------------------------------------------
-  for (const section of ASSESSMENT_SECTION_DEFS) {
-    for (const question of section.questions) {
-      if (!question.requiresEvidence) continue;
-
-      const resp = responseMap.get(question.code);
-      if (!resp) continue; // Already flagged as missing
-
-      // Only flag if the question was answered but evidence is missing
-      const hasResponse = resp.value !== null || resp.numericValue !== null;
-      const hasEvidence = resp.evidenceNotes !== null && resp.evidenceNotes.trim().length > 0;
-
-      if (hasResponse && !hasEvidence) {
-        flags.push({
-          visitId,
-          entityType: 'ASSESSMENT',
-          entityId: assessment.id,
-          flagType: 'MISSING_EVIDENCE',
-          severity: 'MEDIUM',
-          description: `Evidence notes required but missing for "${question.text}" in Section ${section.number} (${section.title})`,
-          fieldName: question.code,
-          currentValue: resp.value ?? String(resp.numericValue),
-          suggestedFix: 'Please add evidence notes to support this response.',
-        });
-      }
-    }
-  }
+  flags.push(...evidenceFlags);
 
   // -----------------------------------------------------------------------
   // Bulk insert all flags
@@ -189,6 +188,20 @@ export async function runDataQualityChecks(visitId: string): Promise<void> {
 // Impossible value checks
 // ---------------------------------------------------------------------------
 
+/** Section 3 testing counts that must not exceed the ANC1 denominator. */
+const TESTING_FIELDS: readonly { code: string; label: string }[] = [
+  { code: 'S3_Q2', label: 'HIV tested' },
+  { code: 'S3_Q4', label: 'Syphilis tested' },
+  { code: 'S3_Q6', label: 'Hepatitis B tested' },
+];
+
+/** Section 4 [denominator code, numerator code, denominator label, numerator label]. */
+const LINKAGE_PAIRS: readonly (readonly [string, string, string, string])[] = [
+  ['S4_Q1', 'S4_Q2', 'HIV positive', 'HIV on ART'],
+  ['S4_Q3', 'S4_Q4', 'Syphilis positive', 'Syphilis treated'],
+  ['S4_Q5', 'S4_Q6', 'HBV positive', 'HBV managed'],
+];
+
 function checkImpossibleValues(
   responseMap: Map<string, {
     value: string | null;
@@ -207,13 +220,7 @@ function checkImpossibleValues(
   const anc1 = anc1Resp?.numericValue ?? null;
 
   if (anc1 !== null && anc1 >= 0) {
-    const testingFields = [
-      { code: 'S3_Q2', label: 'HIV tested' },
-      { code: 'S3_Q4', label: 'Syphilis tested' },
-      { code: 'S3_Q6', label: 'Hepatitis B tested' },
-    ];
-
-    for (const field of testingFields) {
+    for (const field of TESTING_FIELDS) {
       const resp = responseMap.get(field.code);
       if (resp?.numericValue !== null && resp?.numericValue !== undefined && resp.numericValue > anc1) {
         flags.push({
@@ -232,13 +239,7 @@ function checkImpossibleValues(
   }
 
   // Section 4: Positive cases on treatment cannot exceed positive cases
-  const linkagePairs: [string, string, string, string][] = [
-    ['S4_Q1', 'S4_Q2', 'HIV positive', 'HIV on ART'],
-    ['S4_Q3', 'S4_Q4', 'Syphilis positive', 'Syphilis treated'],
-    ['S4_Q5', 'S4_Q6', 'HBV positive', 'HBV managed'],
-  ];
-
-  for (const [denCode, numCode, denLabel, numLabel] of linkagePairs) {
+  for (const [denCode, numCode, denLabel, numLabel] of LINKAGE_PAIRS) {
     const den = responseMap.get(denCode)?.numericValue ?? null;
     const num = responseMap.get(numCode)?.numericValue ?? null;
 
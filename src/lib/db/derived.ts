@@ -58,35 +58,26 @@ export async function updateVisitSummary(visitId: string): Promise<void> {
     },
   });
 
+  const now = new Date();
+
   if (!assessment) {
     // No assessment found; upsert an empty summary
+    const emptySummary = {
+      overallStatus: 'NOT_SCORED' as ColorStatus,
+      redCount: 0,
+      yellowCount: 0,
+      lightGreenCount: 0,
+      darkGreenCount: 0,
+      totalScored: 0,
+      completionPct: 0,
+      criticalFlags: null,
+      topRedDomains: null,
+      computedAt: now,
+    };
     await db.visitSummary.upsert({
       where: { visitId },
-      create: {
-        visitId,
-        overallStatus: 'NOT_SCORED',
-        redCount: 0,
-        yellowCount: 0,
-        lightGreenCount: 0,
-        darkGreenCount: 0,
-        totalScored: 0,
-        completionPct: 0,
-        criticalFlags: null,
-        topRedDomains: null,
-        computedAt: new Date(),
-      },
-      update: {
-        overallStatus: 'NOT_SCORED',
-        redCount: 0,
-        yellowCount: 0,
-        lightGreenCount: 0,
-        darkGreenCount: 0,
-        totalScored: 0,
-        completionPct: 0,
-        criticalFlags: null,
-        topRedDomains: null,
-        computedAt: new Date(),
-      },
+      create: { visitId, ...emptySummary },
+      update: emptySummary,
     });
     return;
   }
@@ -148,33 +139,24 @@ export async function updateVisitSummary(visitId: string): Promise<void> {
     }
   }
 
+  // Build the summary payload once and share it between create and update
+  const summaryData = {
+    overallStatus,
+    redCount,
+    yellowCount,
+    lightGreenCount,
+    darkGreenCount,
+    totalScored,
+    completionPct: assessment.completionPct,
+    criticalFlags: criticalFlags.length > 0 ? JSON.stringify(criticalFlags) : null,
+    topRedDomains: redDomains.length > 0 ? JSON.stringify(redDomains) : null,
+    computedAt: now,
+  };
+
   await db.visitSummary.upsert({
     where: { visitId },
-    create: {
-      visitId,
-      overallStatus,
-      redCount,
-      yellowCount,
-      lightGreenCount,
-      darkGreenCount,
-      totalScored,
-      completionPct: assessment.completionPct,
-      criticalFlags: criticalFlags.length > 0 ? JSON.stringify(criticalFlags) : null,
-      topRedDomains: redDomains.length > 0 ? JSON.stringify(redDomains) : null,
-      computedAt: new Date(),
-    },
-    update: {
-      overallStatus,
-      redCount,
-      yellowCount,
-      lightGreenCount,
-      darkGreenCount,
-      totalScored,
-      completionPct: assessment.completionPct,
-      criticalFlags: criticalFlags.length > 0 ? JSON.stringify(criticalFlags) : null,
-      topRedDomains: redDomains.length > 0 ? JSON.stringify(redDomains) : null,
-      computedAt: new Date(),
-    },
+    create: { visitId, ...summaryData },
+    update: summaryData,
   });
 }
 
@@ -195,6 +177,7 @@ export async function updateDistrictAggregates(
   period?: string,
 ): Promise<void> {
   const targetPeriod = period ?? getCurrentPeriod();
+  const now = new Date();
 
   // Parse period to determine date range
   const { startDate, endDate } = parsePeriodRange(targetPeriod);
@@ -251,24 +234,25 @@ export async function updateDistrictAggregates(
       ? Math.round((totalCompletionPct / summariesCounted) * 100) / 100
       : 0;
 
-    // Identify top red domains across all visits
-    const domainRedCounts: Record<string, number> = {};
-    for (const visit of visits) {
-      // Fetch domain scores for red sections
-      const redScores = await tx.domainScore.findMany({
-        where: {
-          assessment: { visitId: visit.id },
-          colorStatus: 'RED',
-        },
-        select: {
-          section: { select: { title: true } },
-        },
-      });
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+    const visitIds = visits.map((v: any) => v.id);
 
-      for (const score of redScores) {
-        const title = score.section.title;
-        domainRedCounts[title] = (domainRedCounts[title] ?? 0) + 1;
-      }
+    // Identify top red domains across all visits with a single query rather
+    // than one domainScore lookup per visit
+    const redScores = await tx.domainScore.findMany({
+      where: {
+        assessment: { visitId: { in: visitIds } },
+        colorStatus: 'RED',
+      },
+      select: {
+        section: { select: { title: true } },
+      },
+    });
+
+    const domainRedCounts: Record<string, number> = {};
+    for (const score of redScores) {
+      const title = score.section.title;
+      domainRedCounts[title] = (domainRedCounts[title] ?? 0) + 1;
     }
 
     const topRedDomains = Object.entries(domainRedCounts)
@@ -277,9 +261,6 @@ export async function updateDistrictAggregates(
       .map(([title, count]) => ({ title, count }));
 
     // 2. Count action plan statuses for the district
-    // eslint-disable-next-line @typescript-eslint/no-explicit-any
-    const visitIds = visits.map((v: any) => v.id);
-
     const [openActions, overdueActions, completedActions] = await Promise.all([
       tx.actionPlan.count({
         where: {
@@ -292,7 +273,7 @@ export async function updateDistrictAggregates(
         where: {
           visitId: { in: visitIds },
           status: { in: ['OPEN', 'IN_PROGRESS'] },
-          dueDate: { lt: new Date() },
+          dueDate: { lt: now },
           archivedAt: null,
         },
       }),
@@ -357,7 +338,7 @@ export async function updateDistrictAggregates(
         paymentsPending,
         paymentsApproved,
         paymentsPaid,
-        computedAt: new Date(),
+        computedAt: now,
       },
       update: {
         facilitiesAssessed,
@@ -374,7 +355,7 @@ export async function updateDistrictAggregates(
         paymentsPending,
         paymentsApproved,
         paymentsPaid,
-        computedAt: new Date(),
+        computedAt: now,
       },
     });
   });
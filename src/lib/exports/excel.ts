@@ -13,6 +13,16 @@ type Row = Record<string, unknown>;
 // Excel generation
 // ---------------------------------------------------------------------------
 
+/**
+ * Serializes a workbook to an .xlsx Buffer.
+ *
+ * `type: 'buffer'` already yields a Node.js Buffer, so it is returned as-is
+ * rather than copied again through `Buffer.from`.
+ */
+function writeWorkbook(workbook: XLSX.WorkBook): Buffer {
+  return XLSX.write(workbook, { type: 'buffer', bookType: 'xlsx' }) as Buffer;
+}
+
 /**
  * Creates an Excel (.xlsx) workbook buffer from an array of row objects.
  *
@@ -30,19 +40,19 @@ export function generateExcelBuffer(
   if (data.length === 0) {
     const emptySheet = XLSX.utils.aoa_to_sheet([['No data available']]);
     XLSX.utils.book_append_sheet(workbook, emptySheet, sheetName);
-    return Buffer.from(XLSX.write(workbook, { type: 'buffer', bookType: 'xlsx' }));
+    return writeWorkbook(workbook);
   }
 
   const worksheet = XLSX.utils.json_to_sheet(data);
 
   // Auto-calculate column widths
   const headers = Object.keys(data[0]);
+  // Check first 100 rows for max content width
+  const sampleSize = Math.min(data.length, 100);
   const colWidths = headers.map((header) => {
     // Start with header length
     let maxLen = header.length;
 
-    // Check first 100 rows for max content width
-    const sampleSize = Math.min(data.length, 100);
     for (let i = 0; i < sampleSize; i++) {
       const cellValue = data[i][header];
       const cellLen = cellValue != null ? String(cellValue).length : 0;
@@ -57,7 +67,7 @@ export function generateExcelBuffer(
 
   XLSX.utils.book_append_sheet(workbook, worksheet, sheetName.slice(0, 31)); // Sheet name max 31 chars
 
-  return Buffer.from(XLSX.write(workbook, { type: 'buffer', bookType: 'xlsx' }));
+  return writeWorkbook(workbook);
 }
 
 // ---------------------------------------------------------------------------
@@ -19,12 +19,23 @@ type Row = Record<string, unknown>;
 /** Formats a Date to a human-readable string, returns empty string for nulls. */
 function fmtDate(d: Date | null | undefined): string {
   if (!d) return '';
-  return new Date(d).toISOString().slice(0, 10);
+  return d.toISOString().slice(0, 10);
 }
 
 function fmtDateTime(d: Date | null | undefined): string {
   if (!d) return '';
-  return new Date(d).toISOString().replace('T', ' ').slice(0, 19);
+  return d.toISOString().replace('T', ' ').slice(0, 19);
+}
+
+/** Joins a JSON-encoded list with "; ", falling back to the raw string. */
+function fmtJsonList(raw: string | null | undefined): string {
+  if (!raw) return '';
+  try {
+    const parsed = JSON.parse(raw);
+    return Array.isArray(parsed) ? parsed.join('; ') : raw;
+  } catch {
+    return raw;
+  }
 }
 
 /**
@@ -137,20 +148,25 @@ export async function generateRawAssessmentExport(
     ],
   });
 
-  return responses.map((r) => ({
-    'Visit #': r.assessment.visit.visitNumber,
-    'Date': fmtDate(r.assessment.visit.visitDate),
-    'Facility': r.assessment.visit.facility.name,
-    'District': r.assessment.visit.facility.district.name,
-    'Section #': r.question.section.sectionNumber,
-    'Section': r.question.section.title,
-    'Question Code': r.question.questionCode,
-    'Question': r.question.questionText,
-    'Response Type': r.question.responseType,
-    'Response Value': r.value ?? '',
-    'Numeric Value': r.numericValue ?? '',
-    'Evidence Notes': r.evidenceNotes ?? '',
-  }));
+  return responses.map((r) => {
+    const visit = r.assessment.visit;
+    const question = r.question;
+
+    return {
+      'Visit #': visit.visitNumber,
+      'Date': fmtDate(visit.visitDate),
+      'Facility': visit.facility.name,
+      'District': visit.facility.district.name,
+      'Section #': question.section.sectionNumber,
+      'Section': question.section.title,
+      'Question Code': question.questionCode,
+      'Question': question.questionText,
+      'Response Type': question.responseType,
+      'Response Value': r.value ?? '',
+      'Numeric Value': r.numericValue ?? '',
+      'Evidence Notes': r.evidenceNotes ?? '',
+    };
+  });
 }
 
 // ---------------------------------------------------------------------------
@@ -199,21 +215,13 @@ export async function generateAnalyzedAssessmentExport(
   });
 
   return scores.map((s) => {
-    let criticalFlags = '';
-    if (s.criticalFlags) {
-      try {
-        const parsed = JSON.parse(s.criticalFlags);
-        criticalFlags = Array.isArray(parsed) ? parsed.join('; ') : String(s.criticalFlags);
-      } catch {
-        criticalFlags = String(s.criticalFlags);
-      }
-    }
+    const visit = s.assessment.visit;
 
     return {
-      'Visit #': s.assessment.visit.visitNumber,
-      'Date': fmtDate(s.assessment.visit.visitDate),
-      'Facility': s.assessment.visit.facility.name,
-      'District': s.assessment.visit.facility.district.name,
+      'Visit #': visit.visitNumber,
+      'Date': fmtDate(visit.visitDate),
+      'Facility': visit.facility.name,
+      'District': visit.facility.district.name,
       'Assessment Status': s.assessment.status,
       'Section #': s.section.sectionNumber,
       'Section': s.section.title,
@@ -221,7 +229,7 @@ export async function generateAnalyzedAssessmentExport(
       'Max Score': s.maxScore ?? '',
       'Percentage': s.percentage != null ? `${s.percentage.toFixed(1)}%` : '',
       'Color Status': s.colorStatus,
-      'Critical Flags': criticalFlags,
+      'Critical Flags': fmtJsonList(s.criticalFlags),
     };
   });
 }
@@ -351,15 +359,6 @@ export async function generateDistrictSummaryExport(
 
   return districts.map((d) => {
     const agg = d.districtAggregates[0];
-    let topRedDomains = '';
-    if (agg?.topRedDomains) {
-      try {
-        const parsed = JSON.parse(agg.topRedDomains);
-        topRedDomains = Array.isArray(parsed) ? parsed.join('; ') : String(agg.topRedDomains);
-      } catch {
-        topRedDomains = String(agg.topRedDomains);
-      }
-    }
 
     return {
       'District': d.name,
@@ -373,7 +372,7 @@ export async function generateDistrictSummaryExport(
       'Total RED Findings': agg?.totalRedFindings ?? 0,
       'Total YELLOW Findings': agg?.totalYellowFindings ?? 0,
       'Total GREEN Findings': agg?.totalGreenFindings ?? 0,
-      'Top RED Domains': topRedDomains,
+      'Top RED Domains': fmtJsonList(agg?.topRedDomains),
       'Open Actions': agg?.openActions ?? 0,
       'Overdue Actions': agg?.overdueActions ?? 0,
       'Completed Actions': agg?.completedActions ?? 0,
@@ -636,30 +635,34 @@ export async function generatePaymentExport(
     orderBy: { createdAt: 'desc' },
   });
 
-  return payments.map((p) => ({
-    'Full Name': p.namesEntry.fullName,
-    'Role': p.namesEntry.role ?? '',
-    'Team Type': p.namesEntry.teamType,
-    'District': p.namesEntry.districtName ?? p.namesEntry.visit.facility.district.name,
-    'Facility': p.namesEntry.facilityName ?? p.namesEntry.visit.facility.name,
-    'Visit #': p.namesEntry.visit.visitNumber,
-    'Visit Date': fmtDate(p.namesEntry.visit.visitDate),
-    'Phone': p.phone ?? p.namesEntry.phone ?? '',
-    'Network': p.network ?? p.namesEntry.network ?? '',
-    'Payment Category': p.paymentCategory,
-    'Amount': p.amount ?? '',
-    'Currency': p.currency,
-    'Status': p.status,
-    'Transaction Ref': p.transactionRef ?? '',
-    'Approved By': p.approvedBy?.name ?? '',
-    'Approved At': fmtDateTime(p.approvedAt),
-    'Paid By': p.paidBy?.name ?? '',
-    'Paid At': fmtDateTime(p.paidAt),
-    'Reconciled At': fmtDateTime(p.reconciledAt),
-    'Reconcile Note': p.reconcileNote ?? '',
-    'Rejection Reason': p.rejectionReason ?? '',
-    'Created At': fmtDateTime(p.createdAt),
-  }));
+  return payments.map((p) => {
+    const entry = p.namesEntry;
+
+    return {
+      'Full Name': entry.fullName,
+      'Role': entry.role ?? '',
+      'Team Type': entry.teamType,
+      'District': entry.districtName ?? entry.visit.facility.district.name,
+      'Facility': entry.facilityName ?? entry.visit.facility.name,
+      'Visit #': entry.visit.visitNumber,
+      'Visit Date': fmtDate(entry.visit.visitDate),
+      'Phone': p.phone ?? entry.phone ?? '',
+      'Network': p.network ?? entry.network ?? '',
+      'Payment Category': p.paymentCategory,
+      'Amount': p.amount ?? '',
+      'Currency': p.currency,
+      'Status': p.status,
+      'Transaction Ref': p.transactionRef ?? '',
+      'Approved By': p.approvedBy?.name ?? '',
+      'Approved At': fmtDateTime(p.approvedAt),
+      'Paid By': p.paidBy?.name ?? '',
+      'Paid At': fmtDateTime(p.paidAt),
+      'Reconciled At': fmtDateTime(p.reconciledAt),
+      'Reconcile Note': p.reconcileNote ?? '',
+      'Rejection Reason': p.rejectionReason ?? '',
+      'Created At': fmtDateTime(p.createdAt),
+    };
+  });
 }
 
 // ---------------------------------------------------------------------------
@@ -55,8 +55,9 @@ function getNum(responses: ResponseMap, code: string): number | null {
   const r = responses[code];
   if (!r) return null;
   if (r.numericValue !== null && r.numericValue !== undefined) return r.numericValue;
-  if (r.value !== null && !isNaN(Number(r.value))) return Number(r.value);
-  return null;
+  if (r.value === null) return null;
+  const parsed = Number(r.value);
+  return isNaN(parsed) ? null : parsed;
 }
 
 function isYes(responses: ResponseMap, code: string): boolean {
@@ -79,6 +80,12 @@ function safePct(numerator: number | null, denominator: number | null): number |
   return Math.round((numerator / denominator) * 10000) / 100; // 2 decimal places
 }
 
+/** SOP / formalisation questions contain "SOP" or "written" in their text. */
+function isSopQuestion(q: QuestionDef): boolean {
+  const text = q.text.toLowerCase();
+  return text.includes('sop') || text.includes('written');
+}
+
 /**
  * Build a flat map of question values for use in branching visibility checks.
  */
@@ -90,6 +97,36 @@ function buildValueMap(responses: ResponseMap): Record<string, string | null> {
   return map;
 }
 
+// ---------------------------------------------------------------------------
+// Static section component tables
+// ---------------------------------------------------------------------------
+
+/** Section 3: [label, numerator code]; denominator is ANC1 (S3_Q1). */
+const TESTING_COVERAGE_COMPONENTS: readonly (readonly [string, string])[] = [
+  ['HIV testing coverage', 'S3_Q2'],
+  ['Syphilis testing coverage', 'S3_Q4'],
+  ['Hepatitis B testing coverage', 'S3_Q6'],
+];
+
+/** Section 4: [label, numerator code, denominator code]. */
+const LINKAGE_COMPONENTS: readonly (readonly [string, string, string])[] = [
+  ['HIV ART linkage', 'S4_Q2', 'S4_Q1'],
+  ['Syphilis treatment linkage', 'S4_Q4', 'S4_Q3'],
+  ['HBV management linkage', 'S4_Q6', 'S4_Q5'],
+];
+
+/** Section 9: YES/NO screening questions. */
+const STI_SCREENING_CODES = ['S9_Q1', 'S9_Q2', 'S9_Q3'] as const;
+
+/** Section 15: supply chain sub-sections and their labels. */
+const SUPPLY_SUB_SECTIONS = ['A', 'B', 'C', 'D'] as const;
+const SUPPLY_SUB_LABELS: Record<(typeof SUPPLY_SUB_SECTIONS)[number], string> = {
+  A: 'EID',
+  B: 'HIV PMTCT',
+  C: 'Syphilis',
+  D: 'Hepatitis B',
+};
+
 // ---------------------------------------------------------------------------
 // MATURITY LADDER scoring
 // ---------------------------------------------------------------------------
@@ -107,28 +144,31 @@ function scoreMaturityLadder(
     (q) => q.responseType === 'YES_NO' || q.responseType === 'YES_NO_NA',
   );
 
+  // Tally YES/NO answers and split SOP / formalisation questions from the
+  // rest in a single pass
+  let yesCount = 0;
+  let noCount = 0;
+  let sopTotal = 0;
+  let sopYes = 0;
+  let nonSopYes = 0;
+  for (const q of yesNoQuestions) {
+    const value = getVal(responses, q.code);
+    const yes = value === 'YES';
+    if (yes) yesCount++;
+    else if (value === 'NO') noCount++;
+
+    if (isSopQuestion(q)) {
+      sopTotal++;
+      if (yes) sopYes++;
+    } else if (yes) {
+      nonSopYes++;
+    }
+  }
+
   const totalVisible = yesNoQuestions.length;
-  const yesCount = yesNoQuestions.filter((q) => isYes(responses, q.code)).length;
-  const noCount = yesNoQuestions.filter((q) => isNo(responses, q.code)).length;
-
-  // Identify SOP / formalisation questions (contain "SOP" or "written" in text)
-  const sopQuestions = yesNoQuestions.filter(
-    (q) =>
-      q.text.toLowerCase().includes('sop') ||
-      q.text.toLowerCase().includes('written'),
-  );
-  const hasSopQuestions = sopQuestions.length > 0;
-  const allSopsYes =
-    hasSopQuestions && sopQuestions.every((q) => isYes(responses, q.code));
-
-  // Non-SOP questions
-  const nonSopQuestions = yesNoQuestions.filter(
-    (q) =>
-      !q.text.toLowerCase().includes('sop') &&
-      !q.text.toLowerCase().includes('written'),
-  );
-  const nonSopYes = nonSopQuestions.filter((q) => isYes(responses, q.code)).length;
-  const nonSopTotal = nonSopQuestions.length;
+  const nonSopTotal = totalVisible - sopTotal;
+  const hasSopQuestions = sopTotal > 0;
+  const allSopsYes = hasSopQuestions && sopYes === sopTotal;
 
   let colorStatus: ColorStatus;
   const criticalFlags: string[] = [];
@@ -168,7 +208,7 @@ function scoreMaturityLadder(
       totalVisibleQuestions: totalVisible,
       yesCount,
       noCount,
-      sopQuestionsCount: sopQuestions.length,
+      sopQuestionsCount: sopTotal,
       allSopsYes,
     },
   };
@@ -193,17 +233,9 @@ function scorePercentageBased(
   if (section.number === 3) {
     // Triple Elimination Testing
     const anc1 = getNum(responses, 'S3_Q1');
-    const hivTested = getNum(responses, 'S3_Q2');
-    const syphTested = getNum(responses, 'S3_Q4');
-    const hbvTested = getNum(responses, 'S3_Q6');
-
-    const pairs: [string, number | null, string][] = [
-      ['HIV testing coverage', hivTested, 'S3_Q2'],
-      ['Syphilis testing coverage', syphTested, 'S3_Q4'],
-      ['Hepatitis B testing coverage', hbvTested, 'S3_Q6'],
-    ];
 
-    for (const [label, numerator, code] of pairs) {
+    for (const [label, code] of TESTING_COVERAGE_COMPONENTS) {
+      const numerator = getNum(responses, code);
       const pct = safePct(numerator, anc1);
       if (pct !== null) {
         pctComponents.push(pct);
@@ -220,13 +252,7 @@ function scorePercentageBased(
     }
   } else if (section.number === 4) {
     // Triple Elimination Linkage
-    const linkagePairs: [string, string, string][] = [
-      ['HIV ART linkage', 'S4_Q2', 'S4_Q1'],
-      ['Syphilis treatment linkage', 'S4_Q4', 'S4_Q3'],
-      ['HBV management linkage', 'S4_Q6', 'S4_Q5'],
-    ];
-
-    for (const [label, numCode, denCode] of linkagePairs) {
+    for (const [label, numCode, denCode] of LINKAGE_COMPONENTS) {
       const num = getNum(responses, numCode);
       const den = getNum(responses, denCode);
       // If denominator is 0 (no positives), skip this component
@@ -278,7 +304,7 @@ function scoreCountBased(
 
   if (section.number === 9) {
     // STI Screening: count YES answers + chart review proportion
-    const yesCount = ['S9_Q1', 'S9_Q2', 'S9_Q3'].filter((c) => isYes(responses, c)).length;
+    const yesCount = STI_SCREENING_CODES.filter((c) => isYes(responses, c)).length;
     const chartCount = getNum(responses, 'S9_Q4') ?? 0;
     // Total possible: 3 YES questions + 10 charts = weight equally
     // Score = (yesCount/3 * 50) + (chartCount/10 * 50)
@@ -477,17 +503,10 @@ function scoreComposite(
     }
   } else if (section.number === 15) {
     // Supply chain – 4 sub-sections (A, B, C, D)
-    const subSections = ['A', 'B', 'C', 'D'] as const;
-    const subLabels: Record<string, string> = {
-      A: 'EID',
-      B: 'HIV PMTCT',
-      C: 'Syphilis',
-      D: 'Hepatitis B',
-    };
     const subScores: number[] = [];
     const subDetails: Record<string, unknown>[] = [];
 
-    for (const sub of subSections) {
+    for (const sub of SUPPLY_SUB_SECTIONS) {
       const inStock = isYes(responses, `S15_${sub}1`);
       const stockOut = isYes(responses, `S15_${sub}2`); // YES = bad (stock-out occurred)
       const emergencyOrder = isYes(responses, `S15_${sub}3`); // YES = bad
@@ -501,7 +520,7 @@ function scoreComposite(
       subScores.push(score);
       subDetails.push({
         subSection: sub,
-        label: subLabels[sub],
+        label: SUPPLY_SUB_LABELS[sub],
         inStock,
         stockOut,
         emergencyOrder,
@@ -509,10 +528,10 @@ function scoreComposite(
       });
 
       if (!inStock) {
-        criticalFlags.push(`${subLabels[sub]} commodities not in stock`);
+        criticalFlags.push(`${SUPPLY_SUB_LABELS[sub]} commodities not in stock`);
       }
       if (stockOut) {
-        criticalFlags.push(`${subLabels[sub]} stock-out interrupted services`);
+        criticalFlags.push(`${SUPPLY_SUB_LABELS[sub]} stock-out interrupted services`);
       }
     }
 
@@ -678,32 +697,56 @@ export function computeFullAssessment(
   yellowCount: number;
   greenCount: number;
 } {
-  const sectionResults = sections.map((section) => {
-    // Filter responses to only this section's question codes
-    const sectionCodes = new Set(section.questions.map((q) => q.code));
-    const sectionResponses: ResponseMap = {};
-    for (const [code, resp] of Object.entries(allResponses)) {
-      if (sectionCodes.has(code)) {
-        sectionResponses[code] = resp;
-      }
+  // Bucket responses by section in a single pass over all responses,
+  // rather than re-scanning every response once per section.
+  const codeToBucket = new Map<string, ResponseMap>();
+  const buckets = sections.map((section) => {
+    const bucket: ResponseMap = {};
+    for (const q of section.questions) {
+      codeToBucket.set(q.code, bucket);
     }
-    return computeSectionScore(section, sectionResponses);
+    return bucket;
   });
+  for (const [code, resp] of Object.entries(allResponses)) {
+    const bucket = codeToBucket.get(code);
+    if (bucket) bucket[code] = resp;
+  }
+
+  const sectionResults = sections.map((section, i) =>
+    computeSectionScore(section, buckets[i]),
+  );
 
   const overallStatus = computeOverallStatus(sectionResults);
   const criticalFlags = generateCriticalFlags(sectionResults);
 
-  const scored = sectionResults.filter((r) => r.colorStatus !== 'NOT_SCORED');
+  // Tally color statuses in a single pass
+  let redCount = 0;
+  let yellowCount = 0;
+  let greenCount = 0;
+  for (const r of sectionResults) {
+    switch (r.colorStatus) {
+      case 'RED':
+        redCount++;
+        break;
+      case 'YELLOW':
+        yellowCount++;
+        break;
+      case 'LIGHT_GREEN':
+      case 'DARK_GREEN':
+        greenCount++;
+        break;
+      default:
+        break;
+    }
+  }
 
   return {
     sectionResults,
     overallStatus,
     criticalFlags,
-    scoredSectionCount: scored.length,
-    redCount: scored.filter((r) => r.colorStatus === 'RED').length,
-    yellowCount: scored.filter((r) => r.colorStatus === 'YELLOW').length,
-    greenCount: scored.filter(
-      (r) => r.colorStatus === 'LIGHT_GREEN' || r.colorStatus === 'DARK_GREEN',
-    ).length,
+    scoredSectionCount: redCount + yellowCount + greenCount,
+    redCount,
+    yellowCount,
+    greenCount,
   };
 }